@@ -30,6 +30,7 @@ class ACPIGuru:
         self.smbios_model = None
         self.dsdt = None
         self.lpc_bus_device = None
+        self.brace_match = re.compile(r"[{}]")
         self.osi_strings = {
             "Windows 2000": "Windows 2000",
             "Windows XP": "Windows 2001",
@@ -126,6 +127,7 @@ class ACPIGuru:
         trouble_dsdt = None
         fixed = False
         temp = None
+        loaded = None
         prior_tables = self.acpi.acpi_tables # Retain in case of failure
         # Clear any existing tables so we load anew
         self.acpi.acpi_tables = {}
@@ -149,10 +151,10 @@ class ACPIGuru:
                 self.acpi.acpi_tables = prior_tables
                 return
             print("")
-            # We got at least one file - let's look for the DSDT specifically
-            # and try to load that as-is.  If it doesn't load, we'll have to
-            # manage everything with temp folders
-            dsdt_list = [x for x in tables if self.acpi._table_signature(path,x) == "DSDT"]
+            # We got at least one file - let's look for the DSDT specifically.
+            # If it doesn't load as-is, we'll have to manage everything with
+            # temp folders
+            dsdt_list = [x for x in tables if self.acpi._table_signature(path,x) == b"DSDT"]
             if len(dsdt_list) > 1:
                 print("Multiple files with DSDT signature passed:")
                 for d in self.sorted_nicely(dsdt_list):
@@ -166,12 +168,14 @@ class ACPIGuru:
                 return
             # Get the DSDT, if any
             dsdt = dsdt_list[0] if len(dsdt_list) else None
-            if dsdt: # Try to load it and see if it causes problems
-                print("Disassembling {} to verify if pre-patches are needed...".format(dsdt))
-                if not self.acpi.load(os.path.join(path,dsdt))[0]:
+            if dsdt: # Load everything at once and see if the DSDT causes problems
+                print("Loading valid tables in {}...".format(path))
+                loaded = self.acpi.load(path)
+                if dsdt in loaded[1]:
+                    print("\n{} needs pre-patches to disassemble!\n".format(dsdt))
                     trouble_dsdt = dsdt
-                else:
-                    print("\nDisassembled successfully!\n")
+                    # Reload everything once the DSDT is sorted out
+                    loaded = None
         elif not "Patched" in path and os.path.isfile(path):
             print("Loading {}...".format(os.path.basename(path)))
             if self.acpi.load(path)[0]:
@@ -179,7 +183,7 @@ class ACPIGuru:
                 # If it loads fine - just return the path
                 # to the parent directory
                 return os.path.dirname(path)
-            if not self.acpi._table_signature(path) == "DSDT":
+            if not self.acpi._table_signature(path) == b"DSDT":
                 # Not a DSDT, we aren't applying pre-patches
                 print("\n{} could not be disassembled!".format(os.path.basename(path)))
                 print("")
@@ -208,7 +212,7 @@ class ACPIGuru:
             # then try patching the DSDT there
             temp = tempfile.mkdtemp()
             for table in tables:
-                shutil.copy(
+                self.acpi.link_or_copy(
                     os.path.join(path,table),
                     temp
                 )
@@ -232,8 +236,11 @@ class ACPIGuru:
                     repl = binascii.unhexlify(p["Replace"])
                     print(" --> Located - applying...")
                     d = d.replace(find,repl) # Replace it in memory
-                    with open(trouble_path,"wb") as f:
-                        f.write(d) # Write the updated file
+                    # Write the updated file and swap it in - the original may
+                    # be hardlinked to the table we were passed
+                    with open(trouble_path+".tmp","wb") as f:
+                        f.write(d)
+                    os.replace(trouble_path+".tmp",trouble_path)
                     # Attempt to load again
                     if self.acpi.load(trouble_path)[0]:
                         fixed = True
@@ -256,10 +263,12 @@ class ACPIGuru:
                 # Restore any prior tables
                 self.acpi.acpi_tables = prior_tables
                 return
-        # Let's load the rest of the tables
-        if len(tables) > 1:
-            print("Loading valid tables in {}...".format(path))
-        loaded_tables,failed = self.acpi.load(temp or path)
+        # Let's load the rest of the tables - if we haven't already
+        if not loaded:
+            if len(tables) > 1:
+                print("Loading valid tables in {}...".format(path))
+            loaded = self.acpi.load(temp or path)
+        loaded_tables,failed = loaded
         if not loaded_tables or failed:
             print("\nFailed to load tables in {}{}\n".format(
                 os.path.dirname(path) if os.path.isfile(path) else path,
@@ -491,25 +500,9 @@ DefinitionBlock ("", "SSDT", 2, "ZPSS", "CpuPlugA", 0x00003000)
     {""".replace("[[parent]]",parent)
                 # Ensure our name scheme won't conflict
                 schemes = ("C000","CP00","P000","PR00","CX00","PX00")
-                # Walk the processor objects, and add them to the SSDT
-                for i,proc_uid in enumerate(proc_list):
-                    proc,uid = proc_uid
-                    adr = hex(i)[2:].upper()
-                    name = None
-                    for s in schemes:
-                        name_check = s[:-len(adr)]+adr
-                        check_path = "{}.{}".format(parent,name_check)
-                        if self.acpi.get_path_of_type(obj_type="Device",obj=check_path,table=table):
-                            continue # Already defined - skip
-                        # If we got here - we found an unused name
-                        name = name_check
-                        break
-                    if not name:
-                        #print(" - Could not find an available name scheme! Aborting.")
-                        #print("")
-                        #self.u.grab("Press [enter] to return to main menu...")
-                        return
-                    ssdt+="""
+                # Gather each processor's text in a list and join once at the end
+                ssdt_parts = [ssdt]
+                processor_template = """
         Processor ([[name]], [[uid]], 0x00000510, 0x06)
         {
             // [[proc]]
@@ -525,9 +518,8 @@ DefinitionBlock ("", "SSDT", 2, "ZPSS", "CpuPlugA", 0x00003000)
                 {
                     Return (Zero)
                 }
-            }""".replace("[[name]]",name).replace("[[uid]]",uid).replace("[[proc]]",proc)
-                    if i == 0: # Got the first, add plugin-type as well
-                        ssdt += """
+            }"""
+                plugin_type_dsm = """
             Method (_DSM, 4, NotSerialized)
             {
                 If (LNot (Arg2)) {
@@ -540,12 +532,31 @@ DefinitionBlock ("", "SSDT", 2, "ZPSS", "CpuPlugA", 0x00003000)
                     One
                 })
             }"""
+                # Walk the processor objects, and add them to the SSDT
+                for i,proc_uid in enumerate(proc_list):
+                    proc,uid = proc_uid
+                    adr = hex(i)[2:].upper()
+                    name = None
+                    for s in schemes:
+                        name_check = s[:-len(adr)]+adr
+                        check_path = "{}.{}".format(parent,name_check)
+                        if self.acpi.get_path_of_type(obj_type="Device",obj=check_path,table=table):
+                            continue # Already defined - skip
+                        # If we got here - we found an unused name
+                        name = name_check
+                        break
+                    if not name:
+                        #print(" - Could not find an available name scheme! Aborting.")
+                        #print("")
+                        #self.u.grab("Press [enter] to return to main menu...")
+                        return
+                    ssdt_parts.append(processor_template.replace("[[name]]",name).replace("[[uid]]",uid).replace("[[proc]]",proc))
+                    if i == 0: # Got the first, add plugin-type as well
+                        ssdt_parts.append(plugin_type_dsm)
                 # Close up the SSDT
-                    ssdt += """
-        }"""
-                ssdt += """
-    }
-}"""
+                    ssdt_parts.append("\n        }")
+                ssdt_parts.append("\n    }\n}")
+                ssdt = "".join(ssdt_parts)
             #    oc = {"Comment":"Redefines modern CPU Devices as legacy Processor objects and sets plugin-type to 1 on the first","Enabled":True,"Path":ssdt_name+".aml"}
             #self.make_plist(oc, ssdt_name+".aml", ())
             #self.write_ssdt(ssdt_name,ssdt)
@@ -1462,8 +1473,10 @@ DefinitionBlock ("", "SSDT", 2, "ZPSS", "EC", 0x00001000)
         if not os.path.exists(self.acpi_directory):
             os.makedirs(self.acpi_directory)
 
-        with open(dsl_path,"w") as f:
-            f.write(ssdt_content)
+        # Write raw bytes - no newline translation on Windows, and any text we
+        # pulled from the tables encodes back to the bytes we decoded it from
+        with open(dsl_path,"wb") as f:
+            f.write(ssdt_content.encode("latin-1","replace"))
 
         if not compile:
             return False
@@ -1834,8 +1847,9 @@ DefinitionBlock ("", "SSDT", 2, "ZPSS", "[[ALSName]]", 0x00000000)
 
         return power_resource_blocks
 
-    def is_method_in_power_resource(self, method, table_lines):
-        power_resource_blocks = self.findall_power_resource_blocks(table_lines)
+    def is_method_in_power_resource(self, method, table_lines, power_resource_blocks=None):
+        if power_resource_blocks is None:
+            power_resource_blocks = self.findall_power_resource_blocks(table_lines)
         
         for start, end in power_resource_blocks:
             if start <= method[1] <= end:
@@ -1858,11 +1872,15 @@ DefinitionBlock ("", "SSDT", 2, "ZPSS", "[[ALSName]]", 0x00000000)
 
                 off_method_found = ps3_method_found = False
                 for table_name, table_data in self.acpi.acpi_tables.items():
-                    off_methods = self.acpi.get_method_paths("_OFF", table_data)
-                    ps3_methods = self.acpi.get_method_paths("_PS3", table_data)
-
-                    off_method_found = off_method_found or any(method[0].startswith(target_device) and not self.is_method_in_power_resource(method, table_data.get("lines")) for method in off_methods)
-                    ps3_method_found = ps3_method_found or any(method[0].startswith(target_device) for method in ps3_methods)
+                    if not off_method_found:
+                        off_methods = [method for method in self.acpi.get_method_paths("_OFF", table_data) if method[0].startswith(target_device)]
+                        # Only walk the table for PowerResource blocks if it has _OFF
+                        # methods for our device - and then just once for all of them
+                        if off_methods:
+                            power_resource_blocks = self.findall_power_resource_blocks(table_data.get("lines"))
+                            off_method_found = any(not self.is_method_in_power_resource(method, table_data.get("lines"), power_resource_blocks) for method in off_methods)
+                    if not ps3_method_found:
+                        ps3_method_found = any(method[0].startswith(target_device) for method in self.acpi.get_method_paths("_PS3", table_data))
                 
                 if not off_method_found and not ps3_method_found:
                     continue
@@ -2430,15 +2448,6 @@ DefinitionBlock("", "SSDT", 2, "ZPSS", "RMNE", 0x00001000)
             ]
         }
 
-    def is_intel_hedt_cpu(self, processor_name, cpu_codename):
-        if cpu_codename in cpu_data.IntelCPUGenerations[45:66]:
-            return cpu_codename.endswith(("-X", "-P", "-W", "-E", "-EP", "-EX"))
-        
-        if cpu_codename in cpu_data.IntelCPUGenerations[66:]:
-            return "Xeon" in processor_name
-        
-        return False
-    
     def fix_system_clock_hedt(self):
         awac_device = self.acpi.get_device_paths_with_hid("ACPI000E", self.dsdt)
         try:
@@ -2893,36 +2902,25 @@ DefinitionBlock ("", "SSDT", 2, "ZPSS", "SURFACE", 0x00001000)
         }
 
     def find_line_start(self, text, index):
-        current_idx = index
-        while current_idx > 0:
-            if text[current_idx] == '\n':
-                return current_idx + 1
-            current_idx -= 1
-        return 0
+        # Search back from index for the newline ending the prior line
+        return text.rfind("\n", 1, index + 1) + 1
 
     def extract_line(self, text, index):
         start_idx = self.find_line_start(text, index)
-        end_idx = text.index("\n", start_idx) + 1 if "\n" in text[start_idx:] else len(text)
+        end_idx = text.find("\n", start_idx) + 1 or len(text)
         return text[start_idx:end_idx].strip(), start_idx, end_idx
 
     def extract_block_content(self, text, start_idx):
-        try:
-            block_start = text.index("{", start_idx)
-            
-            brace_count = 1
-            pos = block_start + 1
-            
-            while brace_count > 0 and pos < len(text):
-                if text[pos] == '{':
-                    brace_count += 1
-                elif text[pos] == '}':
-                    brace_count -= 1
-                pos += 1
-            
+        block_start = text.find("{", start_idx)
+        if block_start == -1:
+            return ""
+        
+        # Only visit the braces themselves rather than every character
+        brace_count = 0
+        for brace in self.brace_match.finditer(text, block_start):
+            brace_count += 1 if brace.group() == "{" else -1
             if brace_count == 0:
-                return text[block_start:pos]
-        except ValueError as e:
-            pass
+                return text[block_start:brace.end()]
 
         return ""
 
@@ -2963,10 +2961,10 @@ DefinitionBlock ("", "SSDT", 2, "ZPSS", "SURFACE", 0x00001000)
         fields = []
         try:
             field_pattern = f"Field ({region_name}"
-            if field_pattern not in table[start_idx:]:
+            field_start_idx = table.find(field_pattern, start_idx)
+            if field_start_idx == -1:
                 return fields, len(table)
                 
-            field_start_idx = table.index(field_pattern, start_idx)
             field_line, field_start_line_idx, field_end_line_idx = self.extract_line(table, field_start_idx)
             
             field_block = self.extract_block_content(table, field_end_line_idx)
@@ -2995,7 +2993,7 @@ DefinitionBlock ("", "SSDT", 2, "ZPSS", "SURFACE", 0x00001000)
         search_start_idx = 0
         all_fields = []
         
-        while "EmbeddedControl" in self.dsdt.get("table")[search_start_idx:]:
+        while self.dsdt.get("table").find("EmbeddedControl", search_start_idx) != -1:
             region_name, search_start_idx = self.process_embedded_control_region(self.dsdt.get("table"), search_start_idx)
             
             if not region_name:
@@ -3013,7 +3011,7 @@ DefinitionBlock ("", "SSDT", 2, "ZPSS", "SURFACE", 0x00001000)
                 region_fields.extend(fields)
                 current_idx = next_idx
                 
-                if f"Field ({region_name}" not in self.dsdt.get("table")[current_idx:]:
+                if self.dsdt.get("table").find(f"Field ({region_name}", current_idx) == -1:
                     break
             
             all_fields.extend(region_fields)
@@ -3246,7 +3244,7 @@ DefinitionBlock ("", "SSDT", 2, "ZPSS", "WMIS", 0x00000000)
             selected_patches.append("ALS")
             selected_patches.append("PNLF")
 
-        if self.is_intel_hedt_cpu(hardware_report.get("CPU").get("Processor Name"), hardware_report.get("CPU").get("Codename")):
+        if cpu_data.is_intel_hedt_cpu(hardware_report.get("CPU").get("Processor Name"), hardware_report.get("CPU").get("Codename")):
             selected_patches.append("APIC")
 
         for device_name, device_info in disabled_devices.items():
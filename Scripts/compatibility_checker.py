@@ -1,3 +1,4 @@
+from Scripts.datasets import cpu_data
 from Scripts.datasets import gpu_data
 from Scripts.datasets import os_data
 from Scripts.datasets import pci_data
@@ -36,9 +37,6 @@ class CompatibilityChecker:
             os_data.get_macos_name_by_darwin(device_compatibility[0])
         )
         
-    def is_low_end_intel_cpu(self, processor_name):
-        return any(cpu_branding in processor_name for cpu_branding in ("Celeron", "Pentium"))
-
     def check_cpu_compatibility(self):
         max_version = os_data.get_latest_darwin_version()
         min_version = os_data.get_lowest_darwin_version()
@@ -102,7 +100,7 @@ class CompatibilityChecker:
                 else:
                     max_version = min_version = None
 
-                if self.is_low_end_intel_cpu(self.hardware_report.get("CPU").get("Processor Name")):
+                if cpu_data.is_low_end_intel_cpu(self.hardware_report.get("CPU").get("Processor Name")):
                     max_version = min_version = None
             elif "AMD" in gpu_manufacturer:
                 if "Navi 2" in gpu_codename:
@@ -63,9 +63,6 @@ class ConfigProdigy:
 
         return booter_patch
 
-    def is_low_end_intel_cpu(self, processor_name):
-        return any(cpu_branding in processor_name for cpu_branding in ("Celeron", "Pentium"))
-    
     def igpu_properties(self, platform, integrated_gpu, monitor, macos_version):
         igpu_properties = {}
 
@@ -416,23 +413,14 @@ class ConfigProdigy:
         return kernel_block
 
     def is_low_end_haswell_plus(self, processor_name, cpu_codename):
-        return self.is_low_end_intel_cpu(processor_name) and cpu_codename in cpu_data.IntelCPUGenerations[:39]
+        return cpu_data.is_low_end_intel_cpu(processor_name) and cpu_codename in cpu_data.IntelCPUGenerations[:39]
 
-    def is_intel_hedt_cpu(self, processor_name, cpu_codename):
-        if cpu_codename in cpu_data.IntelCPUGenerations[45:66]:
-            return cpu_codename.endswith(("-X", "-P", "-W", "-E", "-EP", "-EX"))
-        
-        if cpu_codename in cpu_data.IntelCPUGenerations[66:]:
-            return "Xeon" in processor_name
-        
-        return False
-    
     def spoof_cpuid(self, processor_name, cpu_codename, macos_version):
         if self.is_low_end_haswell_plus(processor_name, cpu_codename):
             return self.cpuids.get("Ivy Bridge")
-        elif "Haswell" in cpu_codename and self.is_intel_hedt_cpu(processor_name, cpu_codename):
+        elif "Haswell" in cpu_codename and cpu_data.is_intel_hedt_cpu(processor_name, cpu_codename):
             return self.cpuids.get("Haswell")
-        elif "Broadwell" in cpu_codename and self.is_intel_hedt_cpu(processor_name, cpu_codename):
+        elif "Broadwell" in cpu_codename and cpu_data.is_intel_hedt_cpu(processor_name, cpu_codename):
             return self.cpuids.get("Broadwell")
         elif "Tiger Lake" in cpu_codename:
             return self.cpuids.get("Ice Lake")
@@ -509,7 +497,7 @@ class ConfigProdigy:
             "keepsyms=1"
         ]
 
-        if config["Booter"]["Quirks"]["ResizeAppleGpuBars"] != 0 and self.is_intel_hedt_cpu(hardware_report.get("CPU").get("Processor Name"), hardware_report.get("CPU").get("Codename")):
+        if config["Booter"]["Quirks"]["ResizeAppleGpuBars"] != 0 and cpu_data.is_intel_hedt_cpu(hardware_report.get("CPU").get("Processor Name"), hardware_report.get("CPU").get("Codename")):
             boot_args.append("npci=0x2000")
 
         for kext in kexts:
@@ -645,7 +633,7 @@ class ConfigProdigy:
             config["Kernel"]["Emulate"]["Cpuid1Data"] = self.utils.hex_to_bytes("{}{}".format(spoof_cpuid, "0"*8*3))
             config["Kernel"]["Emulate"]["Cpuid1Mask"] = self.utils.hex_to_bytes("{}{}".format("F"*8, "0"*8*3))
         config["Kernel"]["Emulate"]["DummyPowerManagement"] = "AMD" in hardware_report.get("CPU").get("Manufacturer") or \
-            self.is_low_end_intel_cpu(hardware_report.get("CPU").get("Processor Name"))
+            cpu_data.is_low_end_intel_cpu(hardware_report.get("CPU").get("Processor Name"))
         config["Kernel"]["Force"] = []
         config["Kernel"]["Patch"] = self.load_kernel_patch(
             hardware_report.get("Motherboard").get("Chipset"),
@@ -659,7 +647,7 @@ class ConfigProdigy:
         )
         config["Kernel"]["Quirks"]["AppleCpuPmCfgLock"] = hardware_report.get("CPU").get("Codename") in cpu_data.IntelCPUGenerations[62:]
         config["Kernel"]["Quirks"]["AppleXcpmCfgLock"] = False if "AMD" in hardware_report.get("CPU").get("Manufacturer") else not config["Kernel"]["Quirks"]["AppleCpuPmCfgLock"]
-        config["Kernel"]["Quirks"]["AppleXcpmExtraMsrs"] = self.is_intel_hedt_cpu(hardware_report.get("CPU").get("Processor Name"), hardware_report.get("CPU").get("Codename")) and hardware_report.get("CPU").get("Codename") in cpu_data.IntelCPUGenerations[50:]
+        config["Kernel"]["Quirks"]["AppleXcpmExtraMsrs"] = cpu_data.is_intel_hedt_cpu(hardware_report.get("CPU").get("Processor Name"), hardware_report.get("CPU").get("Codename")) and hardware_report.get("CPU").get("Codename") in cpu_data.IntelCPUGenerations[50:]
         config["Kernel"]["Quirks"]["AppleXcpmForceBoost"] = hardware_report.get("CPU").get("Codename") in cpu_data.IntelCPUGenerations[:4]
         config["Kernel"]["Quirks"]["CustomSMBIOSGuid"] = True
         config["Kernel"]["Quirks"]["DisableIoMapper"] = not "AMD" in hardware_report.get("CPU").get("Manufacturer")
@@ -110,4 +110,16 @@ IntelCPUGenerations = [
     "Clarksfield",
     "Gainestown",
     "Bloomfield"
-]
\ No newline at end of file
+]
+
+def is_intel_hedt_cpu(processor_name, cpu_codename):
+    if cpu_codename in IntelCPUGenerations[45:66]:
+        return cpu_codename.endswith(("-X", "-P", "-W", "-E", "-EP", "-EX"))
+    
+    if cpu_codename in IntelCPUGenerations[66:]:
+        return "Xeon" in processor_name
+    
+    return False
+
+def is_low_end_intel_cpu(processor_name):
+    return any(cpu_branding in processor_name for cpu_branding in ("Celeron", "Pentium"))
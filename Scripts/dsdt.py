@@ -1,6 +1,6 @@
 # Original source: https://github.com/corpnewt/SSDTTime/blob/64446d553fcbc14a4e6ebf3d8d16e3357b5cbf50/Scripts/dsdt.py
 
-import os, errno, tempfile, shutil, plistlib, sys, binascii, zipfile, getpass, re
+import os, errno, tempfile, shutil, sys, binascii, re
 from Scripts import github
 from Scripts import resource_fetcher
 from Scripts import run
@@ -40,7 +40,19 @@ class DSDT:
         self.acpi_tables = {}
         # Setup regex matches
         self.hex_match  = re.compile(r"^\s*[0-9A-F]{4,}:(\s[0-9A-F]{2})+(\s+\/\/.*)?$")
-        self.type_match = re.compile(r".*(?P<type>Processor|Scope|Device|Method|Name) \((?P<name>[^,\)]+).*")
+        # Tokenizer used to walk a whole table in one pass when building paths.
+        # Every token starts with one of a handful of characters, which lets
+        # the regex engine skip ahead quickly.  Comments are matched so that
+        # anything within them - including the ASCII dump on hex lines - is
+        # ignored, and runs of hex lines are checked separately.  This stays on
+        # the built-in re module - re2's per-match overhead makes it far slower
+        # for the many small matches a table yields.
+        self.path_match = re.compile(
+            r"(?P<char>[/{}PSDMN])(?:(?<=/)/[^\n]*|(?<=[{}])|"
+            r"(?P<type>(?<=P)rocessor|(?<=S)cope|(?<=D)evice|(?<=M)ethod|(?<=N)ame) \((?P<name>[^,\)\n{}]+))"
+        )
+        hex_line = r"[^\S\n]*[0-9A-F]{4,}:(?:[^\S\n][0-9A-F]{2})+(?:[^\S\n]+//[^\n]*)?$"
+        self.hex_lines_match = re.compile(hex_line+r"(?:\n"+hex_line+r")*",re.MULTILINE)
 
     def _table_signature(self, table_path, table_name = None):
         path = os.path.join(table_path,table_name) if table_name else table_path
@@ -59,6 +71,35 @@ class DSDT:
     def table_is_valid(self, table_path, table_name = None):
         return self._table_signature(table_path,table_name=table_name) in self.allowed_signatures
 
+    def get_work_dir(self, files=()):
+        # Returns a RAM backed folder to hold our temp files if we're on Linux
+        # and /dev/shm is writable with enough room for the passed files and
+        # their disassembled listings - or None to use the default temp folder
+        shm = "/dev/shm"
+        if not sys.platform.startswith("linux") or not os.path.isdir(shm) or not os.access(shm,os.W_OK):
+            return None
+        try:
+            # Mixed listings are far larger than the tables themselves - leave plenty of room
+            needed = 32*sum(os.path.getsize(x) for x in files)
+            stat = os.statvfs(shm)
+            if stat.f_bavail*stat.f_frsize > max(needed,64*1024*1024):
+                return shm
+        except:
+            pass
+        return None
+
+    def link_or_copy(self, source, target_dir):
+        # Hardlinks the source file into target_dir, as the tables are only read
+        # from there - falling back to a copy if that fails (different volume,
+        # unsupported filesystem, etc).  Anything written over a linked file must
+        # replace it rather than write into it.
+        target = os.path.join(target_dir,os.path.basename(source))
+        try:
+            os.link(source,target)
+        except (OSError,AttributeError):
+            shutil.copy(source,target)
+        return target
+
     def get_ascii_print(self, data):
         # Helper to sanitize unprintable characters by replacing them with
         # ? where needed
@@ -100,10 +141,10 @@ class DSDT:
                     os.strerror(errno.ENOENT),
                     "No valid .aml/.dat files found at {}".format(table_path)
                 )
-            # Create a temp dir and copy all files there
-            temp = tempfile.mkdtemp()
+            # Create a temp dir and link or copy all files there
+            temp = tempfile.mkdtemp(dir=self.get_work_dir([os.path.join(table_path,x) for x in valid_files]))
             for file in valid_files:
-                shutil.copy(
+                self.link_or_copy(
                     os.path.join(table_path,file),
                     temp
                 )
@@ -141,33 +182,37 @@ class DSDT:
                     return True
                 return False
             
-            # Check our DSDT and SSDTs first
-            if dsdt_or_ssdt:
-                args = [self.iasl,"-da","-dl","-l"]+list(dsdt_or_ssdt)
-                out_d = self.r.run({"args":args})
-                if out_d[2] != 0:
-                    # Attempt to run without `-da` if the above failed
-                    args = [self.iasl,"-dl","-l"]+list(dsdt_or_ssdt)
+            # Each disassembly is its own iasl process, so run the ones that don't
+            # depend on each other side by side - only imported when we need it
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+                # Other tables (DMAR, APIC, etc) are disassembled on their own - start
+                # those while we handle the DSDT and SSDTs
+                if other_tables:
+                    other_future = executor.submit(self.r.run,{"args":[self.iasl]+list(other_tables)})
+                if dsdt_or_ssdt:
+                    args = [self.iasl,"-da","-dl","-l"]+list(dsdt_or_ssdt)
                     out_d = self.r.run({"args":args})
-                # Get a list of disassembled names that failed
-                fail_temp = []
-                for x in dsdt_or_ssdt:
-                    if not exists(temp,target_files[x]["disassembled_name"]):
-                        fail_temp.append(x)
-                # Let's try to disassemble any that failed individually
-                for x in fail_temp:
-                    args = [self.iasl,"-dl","-l",x]
-                    self.r.run({"args":args})
-                    if not exists(temp,target_files[x]["disassembled_name"]):
-                        failed.append(x)
-            # Check for other tables (DMAR, APIC, etc)
-            if other_tables:
-                args = [self.iasl]+list(other_tables)
-                out_t = self.r.run({"args":args})
-                # Get a list of disassembled names that failed
-                for x in other_tables:
-                    if not exists(temp,target_files[x]["disassembled_name"]):
-                        failed.append(x)
+                    if out_d[2] != 0:
+                        # Attempt to run without `-da` if the above failed
+                        args = [self.iasl,"-dl","-l"]+list(dsdt_or_ssdt)
+                        out_d = self.r.run({"args":args})
+                    # Get a list of disassembled names that failed
+                    fail_temp = []
+                    for x in dsdt_or_ssdt:
+                        if not exists(temp,target_files[x]["disassembled_name"]):
+                            fail_temp.append(x)
+                    # Let's try to disassemble any that failed individually
+                    list(executor.map(lambda x: self.r.run({"args":[self.iasl,"-dl","-l",x]}),fail_temp))
+                    for x in fail_temp:
+                        if not exists(temp,target_files[x]["disassembled_name"]):
+                            failed.append(x)
+                if other_tables:
+                    out_t = other_future.result()
+                    # Get a list of disassembled names that failed
+                    for x in other_tables:
+                        if not exists(temp,target_files[x]["disassembled_name"]):
+                            failed.append(x)
             if len(failed) == len(target_files):
                 raise Exception("Failed to disassemble - {}".format(", ".join(failed)))
             # Actually process the tables now
@@ -178,18 +223,24 @@ class DSDT:
                 if not exists(temp,target_files[file]["disassembled_name"]):
                     to_remove.append(file)
                     continue
-                with open(os.path.join(temp,target_files[file]["disassembled_name"]),"r") as f:
-                    target_files[file]["table"] = f.read()
+                with open(os.path.join(temp,target_files[file]["disassembled_name"]),"rb") as f:
+                    # Read the whole file in one shot and decode it as latin-1 - which
+                    # maps each byte to a single character and can't fail - then
+                    # normalize any line endings ourselves
+                    table = f.read().decode("latin-1")
+                    if "\r" in table:
+                        table = table.replace("\r\n","\n").replace("\r","\n")
                     # Remove the compiler info at the start
-                    if target_files[file]["table"].startswith("/*"):
-                        target_files[file]["table"] = "*/".join(target_files[file]["table"].split("*/")[1:]).strip()
+                    if table.startswith("/*"):
+                        table = table.partition("*/")[2].strip()
                     # Check for "Table Header:" or "Raw Table Data: Length" and strip everything
                     # after the last occurrence
                     for h in ("\nTable Header:","\nRaw Table Data: Length"):
-                        if h in target_files[file]["table"]:
-                            target_files[file]["table"] = h.join(target_files[file]["table"].split(h)[:-1]).rstrip()
+                        if h in table:
+                            table = table.rpartition(h)[0].rstrip()
                             break # Bail on the first match
-                    target_files[file]["lines"] = target_files[file]["table"].split("\n")
+                    target_files[file]["table"] = table
+                    target_files[file]["lines"] = table.split("\n")
                     target_files[file]["scopes"] = self.get_scopes(table=target_files[file])
                     target_files[file]["paths"] = self.get_paths(table=target_files[file])
                 with open(os.path.join(temp,file),"rb") as f:
@@ -222,7 +273,7 @@ class DSDT:
                 # The disassembler omits the last line of hex data in a mixed listing
                 # file... convenient.  However - we should be able to reconstruct this
                 # manually.
-                last_hex = next((l for l in target_files[file]["lines"][::-1] if self.is_hex(l)),None)
+                last_hex = next((l for l in reversed(target_files[file]["lines"]) if self.is_hex(l)),None)
                 if last_hex:
                     # Get the address left of the colon
                     addr = int(last_hex.split(":")[0].strip(),16)
@@ -233,8 +284,9 @@ class DSDT:
                     # Now we need to get the bytes at the end
                     hexb = self.get_hex_bytes(hexs.replace(" ",""))
                     # Get the last occurrence after the split
-                    remaining = target_files[file]["raw"].split(hexb)[-1]
+                    remaining = target_files[file]["raw"].rpartition(hexb)[2]
                     # Iterate in chunks of 16
+                    hex_lines = []
                     for chunk in [remaining[i:i+16] for i in range(0,len(remaining),16)]:
                         # Build a new byte string
                         hex_string = binascii.hexlify(chunk)
@@ -249,8 +301,11 @@ class DSDT:
                         # Increment our address
                         next_addr += len(chunk)
                         # Append our line
-                        target_files[file]["lines"].append(l)
-                        target_files[file]["table"] += "\n"+l
+                        hex_lines.append(l)
+                    if hex_lines:
+                        # Extend the table text once rather than per line
+                        target_files[file]["lines"].extend(hex_lines)
+                        target_files[file]["table"] += "\n"+"\n".join(hex_lines)
             # Remove any that didn't disassemble
             for file in to_remove:
                 target_files.pop(file,None)
@@ -324,7 +379,8 @@ class DSDT:
         if zfile.lower().endswith(".zip"):
             print(" - Extracting")
             search_dir = tempfile.mkdtemp(dir=temp)
-            # Extract with built-in tools \o/
+            # Extract with built-in tools \o/ - only imported when we need it
+            import zipfile
             with zipfile.ZipFile(os.path.join(ztemp,zfile)) as z:
                 z.extractall(search_dir)
         script_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)))
@@ -392,6 +448,7 @@ class DSDT:
             if not os.path.isdir(table_dir):
                 print("Could not locate {}!".format(table_dir))
                 return
+            import getpass
             print("Copying tables to {}...".format(res))
             copied_files = []
             for table in os.listdir(table_dir):
@@ -661,60 +718,86 @@ class DSDT:
                 scopes.append((line,index))
         return scopes
 
+    def get_path_lines(self, text):
+        # Walks the tokens of the passed table text in a single pass, and yields
+        # a tuple of (line index, bracket delta, (type, name)) for each line that
+        # has brackets or a type declared.  Only the last type on a line counts.
+        # If non-hex lines were skipped after a type was declared, a single
+        # (None, 0, None) entry is yielded as they still close out that path.
+        line   = -1
+        offset = 0
+        index  = 0
+        delta  = 0
+        last   = None
+        for match in self.path_match.finditer(text):
+            char = match.group("char")
+            if char == "/":
+                continue # Skip comments
+            start  = match.start()
+            index += text.count("\n",offset,start)
+            if index != line:
+                # Moved on to a new line - yield the prior one
+                if line > -1:
+                    yield (line,delta,last)
+                if last and index > line+1:
+                    # Skipped lines only matter if they could close out the
+                    # path just added - which hex lines can't
+                    if not self.hex_lines_match.fullmatch(text,text.find("\n",offset)+1,text.rfind("\n",0,start)):
+                        yield (None,0,None)
+                line,delta,last = index,0,None
+            offset = start
+            if char == "{":
+                delta += 1
+            elif char == "}":
+                delta -= 1
+            else:
+                last = (char+match.group("type"),match.group("name"))
+        if line > -1:
+            yield (line,delta,last)
+
     def get_paths(self, table=None):
         if not table: table = self.get_dsdt_or_only()
         if not table: return []
         # Set up lists for complete paths, as well
-        # as our current path reference
+        # as our current path reference - each entry retains
+        # its normalized path so children only need to build
+        # on their parent's
         path_list  = []
         _path      = []
         brackets = 0
-        for i,line in enumerate(table.get("lines",[])):
-            if self.is_hex(line):
-                # Skip hex
-                continue
-            line = self.get_line(line)
-            brackets += line.count("{")-line.count("}")
+        for i,delta,type_match in self.get_path_lines(table.get("table","")):
+            brackets += delta
             while len(_path):
                 # Remove any path entries that are nested
                 # equal to or further than our current set
-                if _path[-1][-1] >= brackets:
+                if _path[-1][1] >= brackets:
                     del _path[-1]
                 else:
                     break
-            type_match = self.type_match.match(line)
             if type_match:
+                name = type_match[1]
+                names = name.split(".")
+                # Start a new path if this one is already fully
+                # qualified or has no parent
+                p_check = names[0].rstrip("_")
+                if not _path or p_check.startswith("\\") or p_check in ("_SB","_PR"):
+                    path = []
+                    # Properly qualify the path
+                    if names[0] == "\\": names.pop(0)
+                else:
+                    path = list(_path[-1][2])
+                for x in names:
+                    if "^" in x: # Accommodate caret notation
+                        # Remove the last Y paths to account for going up a level
+                        del path[-1*x.count("^"):]
+                    # Remove any ^ chars, and ensure we strip trailing underscores for consistency
+                    path.append(x.replace("^","").lstrip("\\").rstrip("_"))
                 # Add our path entry and save the full path
                 # to the path list as needed
-                _path.append((type_match.group("name"),brackets))
-                if type_match.group("type") == "Scope":
-                    continue
-                # Ensure that we only consider non-Scope paths that aren't
-                # already fully qualified with a \ prefix
-                path = []
-                for p in _path[::-1]:
-                    path.append(p[0])
-                    p_check = p[0].split(".")[0].rstrip("_")
-                    if p_check.startswith("\\") or p_check in ("_SB","_PR"):
-                        # Fully qualified - bail here
-                        break
-                path = ".".join(path[::-1]).split(".")
-                # Properly qualify the path
-                if len(path) and path[0] == "\\": path.pop(0)
-                if any("^" in x for x in path): # Accommodate caret notation
-                    new_path = []
-                    for x in path:
-                        if x.count("^"):
-                            # Remove the last Y paths to account for going up a level
-                            del new_path[-1*x.count("^"):]
-                        new_path.append(x.replace("^","")) # Add the original, removing any ^ chars
-                    path = new_path
-                if not path:
+                _path.append((name,brackets,path))
+                if type_match[0] == "Scope" or not path:
                     continue
-                # Ensure we strip trailing underscores for consistency
-                padded_path = [("\\" if j==0 else"")+x.lstrip("\\").rstrip("_") for j,x in enumerate(path)]
-                path_str = ".".join(padded_path)
-                path_list.append((path_str,i,type_match.group("type")))
+                path_list.append(("\\"+".".join(path),i,type_match[0]))
         return sorted(path_list)
 
     def get_path_of_type(self, obj_type="Device", obj="HPET", table=None):
@@ -726,8 +809,8 @@ class DSDT:
         obj = ".".join([x.rstrip("_").upper() for x in obj.split(".")])
         obj_type = obj_type.lower() if obj_type else obj_type
         for path in table.get("paths",[]):
-            path_check = ".".join([x.rstrip("_").upper() for x in path[0].split(".")])
-            if (obj_type and obj_type != path[2].lower()) or not path_check.endswith(obj):
+            # get_paths() already strips trailing underscores from each element
+            if (obj_type and obj_type != path[2].lower()) or not path[0].upper().endswith(obj):
                 # Type or object mismatch - skip
                 continue
             paths.append(path)
@@ -748,17 +831,20 @@ class DSDT:
     def get_device_paths_with_hid(self, hid="ACPI000E", table=None):
         if not table: table = self.get_dsdt_or_only()
         if not table: return []
-        devs = []
+        # Normalize the HID once rather than for every _HID line
+        hid = hid.upper()
+        lines = table.get("lines")
+        devs = set()
+        devices = []
+        # Walk the paths once - gathering the matching _HID parents
+        # and every device, then keep the devices we matched
         for p in table.get("paths",[]):
+            if p[-1] == "Device":
+                devices.append(p)
+                continue
             try:
-                if p[0].endswith("._HID") and hid.upper() in table.get("lines")[p[1]]:
+                if p[0].endswith("._HID") and hid in lines[p[1]]:
                     # Save the path, strip the ._HID from the end
-                    devs.append(p[0][:-len("._HID")])
+                    devs.add(p[0][:-len("._HID")])
             except: continue
-        devices = []
-        # Walk the paths again - and save any devices
-        # that match our prior list
-        for p in table.get("paths",[]):
-            if p[0] in devs and p[-1] == "Device":
-                devices.append(p)
-        return devices
+        return [p for p in devices if p[0] in devs]
@@ -68,15 +68,6 @@ class KextMaestro:
 
         return pci_ids
 
-    def is_intel_hedt_cpu(self, processor_name, cpu_codename):
-        if cpu_codename in cpu_data.IntelCPUGenerations[45:66]:
-            return cpu_codename.endswith(("-X", "-P", "-W", "-E", "-EP", "-EX"))
-        
-        if cpu_codename in cpu_data.IntelCPUGenerations[66:]:
-            return "Xeon" in processor_name
-        
-        return False
-
     def check_kext(self, index, target_darwin_version, allow_unsupported_kexts=False):
         kext = self.kexts[index]
 
@@ -233,7 +224,7 @@ class KextMaestro:
         if "Laptop" in hardware_report.get("Motherboard").get("Platform") and ("ASUS" in hardware_report.get("Motherboard").get("Name") or "NootedRed" in selected_kexts):
             selected_kexts.append("ForgedInvariant")
 
-        if self.is_intel_hedt_cpu(hardware_report.get("CPU").get("Processor Name"), hardware_report.get("CPU").get("Codename")):
+        if cpu_data.is_intel_hedt_cpu(hardware_report.get("CPU").get("Processor Name"), hardware_report.get("CPU").get("Codename")):
             selected_kexts.append("CpuTscSync")
 
         if needs_oclp:
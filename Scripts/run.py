@@ -1,12 +1,15 @@
 # Source: https://github.com/corpnewt/SSDTTime/blob/7b3fb78112bf320a1bc6a7e50dddb2b375cb70b0/Scripts/run.py
 
-import sys, subprocess, time, threading, shlex
+import os, sys, subprocess, time, threading, shlex, shutil
 try:
     from Queue import Queue, Empty
 except:
     from queue import Queue, Empty
 
 ON_POSIX = 'posix' in sys.builtin_module_names
+# Resolved executable paths - shared by all Run instances and keyed on PATH
+# so we only walk it once per tool
+WHICH_CACHE = {}
 
 class Run:
 
@@ -82,6 +85,25 @@ class Run:
             return value.decode(encoding,errors)
         return value
 
+    def _which(self, name):
+        key = (name, os.environ.get("PATH"))
+        if not key in WHICH_CACHE:
+            WHICH_CACHE[key] = shutil.which(name)
+        return WHICH_CACHE[key]
+
+    def _spawn_args(self, comm, shell = False):
+        # On POSIX, subprocess can skip fork() and use posix_spawn()/vfork() when
+        # it gets an executable with a directory and doesn't need to close fds
+        # itself.  The resolved path is only passed as the executable, so the
+        # child's argv[0] is left as-is.  Fds Python opens are non-inheritable by
+        # default - though any inherited or C extension fds stay open in the child.
+        if shell or not ON_POSIX or not comm or type(comm) is not list:
+            return (comm, {})
+        path = comm[0] if "/" in comm[0] else self._which(comm[0])
+        if not path:
+            return (comm, {})
+        return (comm, {"executable":path, "close_fds":False})
+
     def _run_command(self, comm, shell = False):
         c = None
         try:
@@ -89,7 +111,8 @@ class Run:
                 comm = " ".join(shlex.quote(x) for x in comm)
             if not shell and type(comm) is str:
                 comm = shlex.split(comm)
-            p = subprocess.Popen(comm, shell=shell, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            comm, kwargs = self._spawn_args(comm, shell)
+            p = subprocess.Popen(comm, shell=shell, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs)
             c = p.communicate()
         except:
             if c == None:
@@ -120,13 +143,13 @@ class Run:
                 continue
             if sudo:
                 # Check if we have sudo
-                out = self._run_command(["which", "sudo"])
-                if "sudo" in out[0]:
+                sudo_path = self._which("sudo") if ON_POSIX else None
+                if sudo_path:
                     # Can sudo
                     if type(args) is list:
-                        args.insert(0, out[0].replace("\n", "")) # add to start of list
+                        args.insert(0, sudo_path) # add to start of list
                     elif type(args) is str:
-                        args = out[0].replace("\n", "") + " " + args # add to start of string
+                        args = sudo_path + " " + args # add to start of string
             
             if show:
                 print(" ".join(args))
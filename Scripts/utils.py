@@ -7,7 +7,6 @@ import re
 import binascii
 import subprocess
 import pathlib
-import zipfile
 import tempfile
 
 class Utils:
@@ -37,10 +36,11 @@ class Utils:
         with open(file_path, "w" if file_extension == ".json" else "wb") as file:
             if file_extension == ".json":
                 json.dump(data, file, indent=4)
+            elif file_extension == ".plist":
+                # Serialize straight into the file rather than building the whole
+                # document in memory first - OpenCore only reads XML plists
+                plistlib.dump(data, file)
             else:
-                if file_extension == ".plist":
-                    data = plistlib.dumps(data)
-
                 file.write(data)
 
     def read_file(self, file_path):
@@ -122,6 +122,7 @@ class Utils:
         
         os.makedirs(extraction_directory, exist_ok=True)
         
+        import zipfile
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
             zip_ref.extractall(extraction_directory)
 
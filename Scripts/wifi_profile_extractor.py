@@ -286,8 +286,6 @@ class WifiProfileExtractor:
         return interfaces
     
     def get_profiles(self):
-        os_name = platform.system()
-
         self.utils.head("WiFi Profile Extractor")
         print("")
         print("\033[1;93mNote:\033[0m")
@@ -0,0 +1,149 @@
+import binascii
+import contextlib
+import io
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Scripts import acpi_guru
+from Scripts import dsdt
+
+# Stands in for iasl - any table containing BADOP fails to disassemble, the
+# rest get a small mixed listing written next to them
+FAKE_IASL = """#!{}
+import os, sys
+status = 0
+for arg in sys.argv[1:]:
+    if arg.startswith("-"):
+        continue
+    with open(arg, "rb") as f:
+        data = f.read()
+    if b"BADOP" in data:
+        status = 1
+        continue
+    with open(os.path.splitext(arg)[0] + ".dsl", "w") as f:
+        f.write(\"\"\"/*
+ * Intel ACPI Component Architecture
+ */
+DefinitionBlock ("", "DSDT", 2, "ABC", "DEF", 0x00000000)
+{{
+    Scope (_SB)
+    {{
+        Device (PCI0)
+    0024: 5B 82 4E 05 50 43 49 30  // [.N.PCI0
+        {{
+            Name (_ADR, Zero)  // _ADR: Address
+        }}
+    }}
+}}
+\"\"\")
+sys.exit(status)
+"""
+
+def aml(signature, body):
+    header = signature + struct.pack("<I", 36 + len(body)) + b"\x02\x00" + b"OEMID " + b"OEMTABLE" + b"\x01\x00\x00\x00" + b"INTL" + b"\x01\x00\x00\x00"
+    return header + body
+
+PRE_PATCH = {
+    "PrePatch": "Fix BADOP",
+    "Comment": "Fix BADOP",
+    "Find": binascii.hexlify(b"BADOP").decode(),
+    "Replace": binascii.hexlify(b"GOOD!").decode()
+}
+
+@unittest.skipUnless(os.name == "posix", "fake iasl is a POSIX script")
+class TestReadAcpiTables(unittest.TestCase):
+    def setUp(self):
+        self.temp = tempfile.mkdtemp()
+        self.iasl = os.path.join(self.temp, "iasl")
+        with open(self.iasl, "w") as f:
+            f.write(FAKE_IASL.format(sys.executable))
+        os.chmod(self.iasl, 0o755)
+        self.tables = os.path.join(self.temp, "ACPI")
+        os.makedirs(self.tables)
+        with mock.patch.object(dsdt.DSDT, "check_iasl", lambda s, **kwargs: self.iasl):
+            self.guru = acpi_guru.ACPIGuru()
+        self.guru.utils.head = lambda *args, **kwargs: None
+        self.guru.utils.request_input = lambda *args, **kwargs: ""
+
+    def tearDown(self):
+        shutil.rmtree(self.temp, ignore_errors=True)
+
+    def write_table(self, name, data):
+        path = os.path.join(self.tables, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def read_acpi_tables(self, path):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.guru.read_acpi_tables(path)
+
+    def test_folder_pre_patches_failing_dsdt(self):
+        dsdt_path = self.write_table("DSDT.aml", aml(b"DSDT", b"\x10BADOP\x00"))
+        self.write_table("SSDT-1.aml", aml(b"SSDT", b"\x10\x00"))
+        self.guru.pre_patches = (PRE_PATCH,)
+        self.assertEqual(self.read_acpi_tables(self.tables), self.tables)
+        self.assertEqual(sorted(self.guru.acpi.acpi_tables), ["DSDT.aml", "SSDT-1.aml"])
+        self.assertEqual(self.guru.dsdt_patches, [PRE_PATCH])
+        self.assertIn(b"GOOD!", self.guru.dsdt.get("raw"))
+        # The patched copy lives in a temp folder - the passed table is untouched
+        with open(dsdt_path, "rb") as f:
+            self.assertIn(b"BADOP", f.read())
+
+    def test_pre_patch_leaves_linked_original_untouched(self):
+        data = aml(b"DSDT", b"\x10BADOP\x00")
+        dsdt_path = self.write_table("DSDT.aml", data)
+        self.guru.pre_patches = (PRE_PATCH,)
+        with mock.patch("os.link", wraps=os.link) as link:
+            self.assertEqual(self.read_acpi_tables(self.tables), self.tables)
+        # The temp folder shares a volume with our tables, so the DSDT was linked
+        self.assertIn(dsdt_path, [call.args[0] for call in link.call_args_list])
+        self.assertIn(b"GOOD!", self.guru.dsdt.get("raw"))
+        with open(dsdt_path, "rb") as f:
+            self.assertEqual(f.read(), data)
+        self.assertEqual(os.stat(dsdt_path).st_nlink, 1)
+
+    def test_single_file_pre_patches_failing_dsdt(self):
+        dsdt_path = self.write_table("DSDT.aml", aml(b"DSDT", b"\x10BADOP\x00"))
+        self.guru.pre_patches = (PRE_PATCH,)
+        self.assertEqual(self.read_acpi_tables(dsdt_path), self.tables)
+        self.assertEqual(self.guru.dsdt_patches, [PRE_PATCH])
+        self.assertIn(b"GOOD!", self.guru.dsdt.get("raw"))
+
+    def test_unpatchable_dsdt_restores_prior_tables(self):
+        self.write_table("DSDT.aml", aml(b"DSDT", b"\x10BADOP\x00"))
+        self.guru.pre_patches = ()
+        self.guru.acpi.acpi_tables = prior_tables = {"prior": {}}
+        self.assertIsNone(self.read_acpi_tables(self.tables))
+        self.assertIs(self.guru.acpi.acpi_tables, prior_tables)
+
+    def test_multiple_dsdts_are_rejected(self):
+        self.write_table("DSDT.aml", aml(b"DSDT", b"\x10\x00"))
+        self.write_table("DSDT-2.aml", aml(b"DSDT", b"\x10\x00"))
+        self.assertIsNone(self.read_acpi_tables(self.tables))
+        self.assertEqual(self.guru.acpi.acpi_tables, {})
+
+    def test_folder_loads_without_pre_patches(self):
+        self.write_table("DSDT.aml", aml(b"DSDT", b"\x10\x00"))
+        self.write_table("SSDT-1.aml", aml(b"SSDT", b"\x10\x00"))
+        self.guru.pre_patches = (PRE_PATCH,)
+        self.assertEqual(self.read_acpi_tables(self.tables), self.tables)
+        self.assertEqual(sorted(self.guru.acpi.acpi_tables), ["DSDT.aml", "SSDT-1.aml"])
+        self.assertIn("\\_SB.PCI0", [p[0] for p in self.guru.dsdt.get("paths")])
+
+    def test_folder_with_working_dsdt_loads_once(self):
+        self.write_table("DSDT.aml", aml(b"DSDT", b"\x10\x00"))
+        self.write_table("SSDT-1.aml", aml(b"SSDT", b"\x10\x00"))
+        with mock.patch.object(self.guru.acpi, "load", wraps=self.guru.acpi.load) as load:
+            self.assertEqual(self.read_acpi_tables(self.tables), self.tables)
+        load.assert_called_once_with(self.tables)
+
+if __name__ == "__main__":
+    unittest.main()
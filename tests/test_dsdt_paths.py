@@ -0,0 +1,170 @@
+import os
+import re
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Scripts import dsdt
+
+hex_match  = re.compile(r"^\s*[0-9A-F]{4,}:(\s[0-9A-F]{2})+(\s+\/\/.*)?$")
+type_match = re.compile(r".*(?P<type>Processor|Scope|Device|Method|Name) \((?P<name>[^,\)]+).*")
+
+def old_get_line(line):
+    line = line.split("//")[0]
+    if ":" in line:
+        return line.split(":")[1]
+    return line
+
+def old_get_paths(lines):
+    # The line by line walk get_paths() used before the single pass tokenizer
+    path_list = []
+    _path = []
+    brackets = 0
+    for i,line in enumerate(lines):
+        if hex_match.match(line):
+            continue
+        line = old_get_line(line)
+        brackets += line.count("{")-line.count("}")
+        while len(_path):
+            if _path[-1][-1] >= brackets:
+                del _path[-1]
+            else:
+                break
+        match = type_match.match(line)
+        if match:
+            _path.append((match.group("name"),brackets))
+            if match.group("type") == "Scope":
+                continue
+            path = []
+            for p in _path[::-1]:
+                path.append(p[0])
+                p_check = p[0].split(".")[0].rstrip("_")
+                if p_check.startswith("\\") or p_check in ("_SB","_PR"):
+                    break
+            path = ".".join(path[::-1]).split(".")
+            if len(path) and path[0] == "\\": path.pop(0)
+            if any("^" in x for x in path):
+                new_path = []
+                for x in path:
+                    if x.count("^"):
+                        del new_path[-1*x.count("^"):]
+                    new_path.append(x.replace("^",""))
+                path = new_path
+            if not path:
+                continue
+            padded_path = [("\\" if j==0 else"")+x.lstrip("\\").rstrip("_") for j,x in enumerate(path)]
+            path_list.append((".".join(padded_path),i,match.group("type")))
+    return sorted(path_list)
+
+LISTING = """DefinitionBlock ("", "DSDT", 2, "ABC", "DEF", 0x00000000)
+{
+    External (_SB_.PCI0.GFX0, DeviceObj)
+    0024: 15 5C 2F 03 5F 53 42 5F 50 43 49 30 47 46 58 30  // .\\/._SB_PCI0GFX0
+    Scope (\\)
+    {
+        Name (OSYS, 0x07DF)
+    0035: 08 4F 53 59 53 0B DF 07  // .OSYS...
+    }
+
+    Scope (_SB)
+    {
+        Device (PCI0)
+    003D: 5B 82 4E 05 50 43 49 30  // [.N.PCI0
+        {
+            Name (_HID, EisaId ("PNP0A08") /* PCI Express Bus */)  // _HID: Hardware ID
+    0045: 08 5F 48 49 44 0C 41 D0 0A 08  // ._HID.A...
+            Device (LPCB)
+    004F: 5B 82 2F 4C 50 43 42  // [./LPCB
+    0056: 08 5F 41 44 52 0C 00 00 1F 00  // ._ADR....
+            {
+                Name (_ADR, 0x001F0000)  // _ADR: Address
+                Device (EC0_)
+                {
+                    Method (_STA, 0, NotSerialized)  // _STA: Status
+                    {
+                        Return (^^^GFX0._STA ())
+                    }
+                }
+                Method (_INI, 0, NotSerialized)
+
+                {
+                    Name (INIX, Zero)
+                }
+                Method (XINI, 0, NotSerialized)
+                // a lone comment line
+                {
+                    Name (XINX, Zero)
+                }
+            }
+
+            Scope (^LPCB)
+            {
+                Device (^^PEG0)
+                {
+                }
+            }
+        }
+
+        Processor (CPU0, 0x01, 0x00000410, 0x06)
+        {
+        }
+    }
+
+    Scope (_SB.PCI0.LPCB)
+    {
+        Device (\\_SB.HPET)
+        {
+            Name (_HID, EisaId ("PNP0103"))  // _HID: Hardware ID
+        }
+    }
+}"""
+
+# Declarations that the old walk dropped as get_line() kept only the text
+# between the first two colons - the tokenizer records them
+COLON_LISTING = """DefinitionBlock ("", "DSDT", 2, "ABC", "DEF", 0x00000000)
+{
+    Scope (_SB)
+    {
+        Device (PCI0)
+        {
+            Device (LPCB)
+            {
+                Name (_STR, Unicode ("a:b"))
+                Name (_UID, "http://x")
+            }
+        }
+    }
+    /* x :: */ Device (FOO)
+    {
+    }
+}"""
+
+class TestGetPaths(unittest.TestCase):
+    def setUp(self):
+        with mock.patch.object(dsdt.DSDT, "check_iasl", lambda self, **kwargs: "iasl"):
+            self.acpi = dsdt.DSDT()
+
+    def get_paths(self, text):
+        return self.acpi.get_paths(table={"table":text,"lines":text.split("\n")})
+
+    def test_matches_line_walk(self):
+        self.assertEqual(self.get_paths(LISTING), old_get_paths(LISTING.split("\n")))
+
+    def test_listing_paths(self):
+        paths = [p[0] for p in self.get_paths(LISTING)]
+        for path in ("\\OSYS", "\\_SB.PCI0", "\\_SB.PCI0._HID", "\\_SB.PCI0.LPCB", "\\_SB.PCI0.LPCB.EC0._STA",
+                     "\\_SB.PCI0.LPCB._INI", "\\_SB.PCI0.LPCB.XINI", "\\_SB.PCI0.LPCB._ADR",
+                     "\\_SB.PCI0.LPCB.INIX", "\\_SB.PCI0.LPCB.XINX", "\\_SB.CPU0", "\\_SB.HPET._HID"):
+            self.assertIn(path, paths)
+
+    def test_colons_outside_comments(self):
+        paths = self.get_paths(COLON_LISTING)
+        old_paths = old_get_paths(COLON_LISTING.split("\n"))
+        added = [p[0] for p in paths if not p in old_paths]
+        self.assertEqual(sorted(added), ["\\FOO", "\\_SB.PCI0.LPCB._STR", "\\_SB.PCI0.LPCB._UID"])
+        self.assertTrue(all(p in paths for p in old_paths))
+
+if __name__ == "__main__":
+    unittest.main()